@@ -0,0 +1,85 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "visitors",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("phone", sa.String(), nullable=True),
+        sa.Column("id_number", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_visitors_id"), "visitors", ["id"], unique=False)
+    op.create_index(op.f("ix_visitors_email"), "visitors", ["email"], unique=False)
+
+    op.create_table(
+        "hosts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("phone", sa.String(), nullable=True),
+        sa.Column("department", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_hosts_id"), "hosts", ["id"], unique=False)
+    op.create_index(op.f("ix_hosts_email"), "hosts", ["email"], unique=True)
+
+    op.create_table(
+        "visit_logs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("visitor_id", sa.Integer(), nullable=False),
+        sa.Column("host_id", sa.Integer(), nullable=False),
+        sa.Column("purpose", sa.String(), nullable=True),
+        sa.Column("check_in_time", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("check_out_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["host_id"], ["hosts.id"]),
+        sa.ForeignKeyConstraint(["visitor_id"], ["visitors.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_visit_logs_id"), "visit_logs", ["id"], unique=False)
+
+    op.create_table(
+        "admin_users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_admin_users_id"), "admin_users", ["id"], unique=False)
+    op.create_index(op.f("ix_admin_users_username"), "admin_users", ["username"], unique=True)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_admin_users_username"), table_name="admin_users")
+    op.drop_index(op.f("ix_admin_users_id"), table_name="admin_users")
+    op.drop_table("admin_users")
+    op.drop_index(op.f("ix_visit_logs_id"), table_name="visit_logs")
+    op.drop_table("visit_logs")
+    op.drop_index(op.f("ix_hosts_email"), table_name="hosts")
+    op.drop_index(op.f("ix_hosts_id"), table_name="hosts")
+    op.drop_table("hosts")
+    op.drop_index(op.f("ix_visitors_email"), table_name="visitors")
+    op.drop_index(op.f("ix_visitors_id"), table_name="visitors")
+    op.drop_table("visitors")
@@ -0,0 +1,24 @@
+"""index visit_logs.check_in_time for recent-first listing
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_visitlog_checkin_desc", "visit_logs", [sa.text("check_in_time DESC")], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_visitlog_checkin_desc", table_name="visit_logs")
@@ -0,0 +1,23 @@
+"""index visitors(full_name, email) for check-in lookups
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_visitor_fullname_email", "visitors", ["full_name", "email"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_visitor_fullname_email", table_name="visitors")
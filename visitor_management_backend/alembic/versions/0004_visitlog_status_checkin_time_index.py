@@ -0,0 +1,29 @@
+"""index visit_logs(status, check_in_time DESC) for status-filtered listing
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_visitlog_status_checkin_desc",
+        "visit_logs",
+        ["status", sa.text("check_in_time DESC")],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_visitlog_status_checkin_desc", table_name="visit_logs")
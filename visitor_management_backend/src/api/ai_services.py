@@ -7,16 +7,76 @@ For production, set up API keys and cloud service configs as needed.
 
 import io
 import os
-from typing import Optional
+import tempfile
+import threading
+from typing import BinaryIO, Optional, Union
+
+
+def _as_stream(data: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a BytesIO; file objects (e.g. an upload's spooled temp file) pass through uncopied."""
+    return io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+
 
 # --- OCR ---
 try:
-    import pytesseract
     from PIL import Image
 except ImportError:
-    pytesseract = None
     Image = None
 
+# Preferred: tesserocr keeps Tesseract loaded in-process (no subprocess or temp file per call)
+try:
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+# Fallback: pytesseract shells out to the tesseract binary
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+# Optional: OpenCV binarization before OCR (falls back to plain grayscale)
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+    np = None
+
+# Longest image edge passed to Tesseract; larger phone photos only add scan time
+_OCR_MAX_EDGE = 1600
+
+# A PyTessBaseAPI instance is not thread-safe: build one lazily per process, share it under a lock
+_ocr_api = None
+_ocr_api_failed = False
+_ocr_lock = threading.Lock()
+
+
+def _get_ocr_api():
+    """
+    Return the shared tesserocr API, initializing it on first use. Caller must hold _ocr_lock.
+    Returns None if initialization failed (e.g. missing eng.traineddata / bad TESSDATA_PREFIX);
+    the failure is remembered so OCR falls back to pytesseract instead of retrying every call.
+    """
+    global _ocr_api, _ocr_api_failed
+    if _ocr_api is None and not _ocr_api_failed:
+        try:
+            _ocr_api = PyTessBaseAPI(lang="eng")
+        except Exception:
+            _ocr_api_failed = True
+    return _ocr_api
+
+
+def _preprocess_for_ocr(image):
+    """Downscale, grayscale and (with OpenCV) Otsu-threshold an image so Tesseract scans fewer, cleaner pixels."""
+    if max(image.size) > _OCR_MAX_EDGE:
+        image.thumbnail((_OCR_MAX_EDGE, _OCR_MAX_EDGE), Image.LANCZOS)
+    image = image.convert("L")
+    if cv2 is not None:
+        _, arr = cv2.threshold(np.array(image), 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        image = Image.fromarray(arr)
+    return image
+
 # --- Speech-To-Text ---
 try:
     import speech_recognition as sr
@@ -29,23 +89,45 @@ try:
 except ImportError:
     pyttsx3 = None
 
+# pyttsx3 engines are costly to create and not thread-safe: build one lazily, share it under a lock
+_tts_engine = None
+_tts_lock = threading.Lock()
+
+
+def _get_tts_engine():
+    """Return the shared pyttsx3 engine, initializing it on first use. Caller must hold _tts_lock."""
+    global _tts_engine
+    if _tts_engine is None:
+        _tts_engine = pyttsx3.init()
+    return _tts_engine
+
 
 # PUBLIC_INTERFACE
-def perform_ocr_on_image(file_bytes: bytes) -> dict:
+def perform_ocr_on_image(file_bytes: Union[bytes, BinaryIO]) -> dict:
     """
     Run OCR on the provided image file bytes.
 
     Args:
-        file_bytes (bytes): Image file data.
+        file_bytes (bytes | BinaryIO): Image file data, or a readable binary file object.
 
     Returns:
         dict: Extracted fields {field_name: value}
     """
-    if not pytesseract or not Image:
+    if not Image or not (PyTessBaseAPI or pytesseract):
         return {"error": "OCR library not installed"}
     try:
-        image = Image.open(io.BytesIO(file_bytes))
-        text = pytesseract.image_to_string(image)
+        image = _preprocess_for_ocr(Image.open(_as_stream(file_bytes)))
+        text = None
+        if PyTessBaseAPI:
+            with _ocr_lock:
+                api = _get_ocr_api()
+                if api is not None:
+                    api.SetImage(image)
+                    text = api.GetUTF8Text()
+        if text is None:
+            if not pytesseract:
+                return {"error": "tesserocr failed to initialize and pytesseract is not installed"}
+            text = pytesseract.image_to_string(image)
         # Dummy logic: split to lines & pick "full_name" and "id_number"
         lines = [l.strip() for l in text.splitlines() if l.strip()]
         return {
@@ -57,12 +139,12 @@ def perform_ocr_on_image(file_bytes: bytes) -> dict:
 
 
 # PUBLIC_INTERFACE
-def perform_speech_to_text(audio_bytes: bytes, language: str = "en-US") -> dict:
+def perform_speech_to_text(audio_bytes: Union[bytes, BinaryIO], language: str = "en-US") -> dict:
     """
     Convert audio bytes (wav, mp3, etc.) to text using STT.
 
     Args:
-        audio_bytes (bytes): Audio file data.
+        audio_bytes (bytes | BinaryIO): Audio file data, or a readable binary file object.
         language (str): Language code ("en-US", etc.)
 
     Returns:
@@ -73,7 +155,7 @@ def perform_speech_to_text(audio_bytes: bytes, language: str = "en-US") -> dict:
     # Use SpeechRecognition with a default recognizer and Google Web API for demo (no API key required for basic usage)
     rec = sr.Recognizer()
     try:
-        with sr.AudioFile(io.BytesIO(audio_bytes)) as source:
+        with sr.AudioFile(_as_stream(audio_bytes)) as source:
             audio = rec.record(source)
             transcript = rec.recognize_google(audio, language=language)
             return {"transcript": transcript, "language": language}
@@ -96,18 +178,21 @@ def perform_text_to_speech(text: str, language: str = "en") -> Optional[bytes]:
     if not pyttsx3:
         return None
     try:
-        engine = pyttsx3.init()
-        # Optionally, set language here if needed
-        # For demo, English is fine
         # pyttsx3 does not have native support to write to BytesIO,
-        # so this workaround: save as wav file temporarily
-        tmpfile = "/tmp/tts_speak.wav"
-        engine.save_to_file(text, tmpfile)
-        engine.runAndWait()
-        with open(tmpfile, "rb") as f:
-            audio_data = f.read()
-        os.remove(tmpfile)
+        # so this workaround: save to a per-call temp file (safe under concurrency)
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tf:
+            tmpfile = tf.name
+        try:
+            with _tts_lock:
+                engine = _get_tts_engine()
+                # Optionally, set language here if needed
+                # For demo, English is fine
+                engine.save_to_file(text, tmpfile)
+                engine.runAndWait()
+            with open(tmpfile, "rb", buffering=65536) as f:
+                audio_data = f.read()
+        finally:
+            os.unlink(tmpfile)
         return audio_data
     except Exception:
         return None
-
@@ -1,21 +1,25 @@
 """
 Database connection/session configuration for FastAPI app.
-Uses SQLAlchemy with PostgreSQL.
+Uses SQLAlchemy (asyncio extension) with PostgreSQL via asyncpg.
 """
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import NullPool
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # PUBLIC_INTERFACE
+@lru_cache(maxsize=1)
 def get_postgres_url():
     """
-    Constructs PostgreSQL connection string from environment variables.
+    Constructs the PostgreSQL (psycopg2) connection URL from environment variables.
+    Built once per process (after load_dotenv) and cached; the app and Alembic share the value.
+    Returned as a URL object: str() of it masks the password, so do not round-trip through strings.
     Requires:
         - POSTGRES_USER
         - POSTGRES_PASSWORD
@@ -23,29 +27,42 @@ def get_postgres_url():
         - POSTGRES_HOST
         - POSTGRES_PORT
     """
-    return str(
-        URL.create(
-            drivername="postgresql+psycopg2",
-            username=os.getenv("POSTGRES_USER"),
-            password=os.getenv("POSTGRES_PASSWORD"),
-            host=os.getenv("POSTGRES_HOST", "localhost"),
-            port=os.getenv("POSTGRES_PORT", 5432),
-            database=os.getenv("POSTGRES_DB"),
-        )
+    return URL.create(
+        drivername="postgresql+psycopg2",
+        username=os.getenv("POSTGRES_USER"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=os.getenv("POSTGRES_PORT", 5432),
+        database=os.getenv("POSTGRES_DB"),
     )
 
-SQLALCHEMY_DATABASE_URL = get_postgres_url()
+# The app talks to PostgreSQL through asyncpg; the psycopg2 URL above is kept for Alembic.
+SQLALCHEMY_DATABASE_URL = get_postgres_url().set(drivername="postgresql+asyncpg")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, pool_recycle=3600)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# PgBouncer (default port 6432) already pools server connections, so keeping a second
+# pool in-process only pins idle connections. In transaction mode asyncpg's prepared
+# statement cache must also be disabled, as consecutive statements may hit different backends.
+if str(os.getenv("POSTGRES_PORT", 5432)) == "6432":
+    engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+else:
+    engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", 20)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # PUBLIC_INTERFACE
-def get_db():
+async def get_db():
     """
-    Yields a new database session.
+    Yields a new async database session.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,11 +1,17 @@
+from cachetools import TTLCache
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field, EmailStr
+from fastapi.responses import Response, ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, make_transient_to_detached
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import List, Optional, Dict, Any
+from starlette.concurrency import run_in_threadpool
 from starlette.status import HTTP_400_BAD_REQUEST
-import io
+import re
 import datetime
 
 from .database import get_db
@@ -21,6 +27,8 @@ app = FastAPI(
     title="Visitor Management Kiosk Backend",
     description="API for Visitor Kiosk (Check-in, Speech, OCR, Notifications, Admin) with conversational logic and PostgreSQL integration.",
     version="1.0.0",
+    # orjson encodes the admin list payloads several times faster than the stdlib json module
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {"name": "visitor", "description": "Visitor check-in and management"},
         {"name": "ocr", "description": "ID OCR upload"},
@@ -46,6 +54,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# -------------------- Validation Patterns --------------------
+
+# Compiled once at import; shared by check-in steps and field validation
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_PHONE_RE = re.compile(r"\d{7,15}")
+
 # -------------------- Pydantic Schemas --------------------
 
 class VisitorCheckinStepRequest(BaseModel):
@@ -66,10 +80,10 @@ class VisitorCheckinStepResponse(BaseModel):
 
 
 class VisitorCreatePayload(BaseModel):
-    full_name: str = Field(..., example="Alice Smith")
-    email: Optional[EmailStr]
-    phone: Optional[str]
-    id_number: Optional[str]
+    full_name: str = Field(..., examples=["Alice Smith"])
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = None
+    id_number: Optional[str] = None
 
 
 class VisitorOut(BaseModel):
@@ -80,8 +94,7 @@ class VisitorOut(BaseModel):
     id_number: Optional[str]
     created_at: datetime.datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HostOut(BaseModel):
@@ -91,8 +104,7 @@ class HostOut(BaseModel):
     phone: Optional[str]
     department: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VisitLogOut(BaseModel):
@@ -104,8 +116,7 @@ class VisitLogOut(BaseModel):
     check_out_time: Optional[datetime.datetime]
     status: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AdminUserOut(BaseModel):
@@ -115,8 +126,14 @@ class AdminUserOut(BaseModel):
     is_active: bool
     created_at: datetime.datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AdminDashboardOut(BaseModel):
+    """First page of visitors, visit logs (most recent first) and hosts for the admin dashboard in one payload."""
+    visitors: List[VisitorOut]
+    visitlogs: List[VisitLogOut]
+    hosts: List[HostOut]
 
 class FieldValidationRequest(BaseModel):
     field: str = Field(..., description="'email', 'phone', or other field name to validate")
@@ -143,6 +160,25 @@ def health_check():
 
 # -------------------- Conversational Visitor Check-in APIs --------------------
 
+# Check-in fields in the order they are asked for, with their prompts
+_CHECKIN_FIELDS = (
+    ("full_name", "What is your full name?"),
+    ("email",    "What is your email address? (You may skip)"),
+    ("phone",    "And your phone number? (optional)"),
+    ("id_number", "Do you have an ID or passport number to provide? (optional)"),
+    ("host_email", "Who are you visiting today? Please provide their email."),
+    ("purpose",   "What is the purpose of your visit?"),
+)
+
+
+def _next_missing(state: Dict[str, str]):
+    """Return (field, prompt) for the first check-in field not yet filled in state, or (None, None)."""
+    for field, prompt in _CHECKIN_FIELDS:
+        if not state.get(field):
+            return field, prompt
+    return None, None
+
+
 # PUBLIC_INTERFACE
 @app.post("/api/visitor/checkin-step", response_model=VisitorCheckinStepResponse, tags=["visitor"])
 def visitor_checkin_step(payload: VisitorCheckinStepRequest):
@@ -151,27 +187,12 @@ def visitor_checkin_step(payload: VisitorCheckinStepRequest):
     Receives user input and partial conversation state,
     returns next prompt, next expected field, and updated state.
     """
-    expected_fields_order = [
-        ("full_name", "What is your full name?"),
-        ("email",    "What is your email address? (You may skip)"),
-        ("phone",    "And your phone number? (optional)"),
-        ("id_number", "Do you have an ID or passport number to provide? (optional)"),
-        ("host_email", "Who are you visiting today? Please provide their email."),
-        ("purpose",   "What is the purpose of your visit?"),
-    ]
-
     state = payload.conversation_state.copy()
     errors = []
-    next_prompt = None
-    next_field = None
     is_complete = False
 
-    # Decision logic: Walk through fields, find next
-    for field, prompt in expected_fields_order:
-        if not state.get(field):
-            next_prompt = prompt
-            next_field = field
-            break
+    # Decision logic: find next field to ask for
+    next_field, next_prompt = _next_missing(state)
 
     # Dummy validation and field value assignment
     raw_input = payload.user_input.strip()
@@ -180,18 +201,16 @@ def visitor_checkin_step(payload: VisitorCheckinStepRequest):
 
         # Simple validations example
         if next_field == "email":
-            if "@" not in raw_input:
+            if not _EMAIL_RE.fullmatch(raw_input):
                 errors.append("Invalid email format.")
         if next_field == "host_email":
-            if "@" not in raw_input:
+            if not _EMAIL_RE.fullmatch(raw_input):
                 errors.append("Please provide a valid email for the host.")
 
         # Now check again what's next after assignment
-        for field, prompt in expected_fields_order:
-            if not state.get(field):
-                next_prompt = prompt
-                next_field = field
-                break
+        field, prompt = _next_missing(state)
+        if field:
+            next_field, next_prompt = field, prompt
         else:
             is_complete = True
             next_prompt = "Thank you, your check-in data is almost complete. Please scan your ID, if required."
@@ -205,9 +224,15 @@ def visitor_checkin_step(payload: VisitorCheckinStepRequest):
     )
 
 
+# Snapshots of every hosts column by email, reused across check-ins to the same host; taking all
+# columns means a host rebuilt from the cache is fully loaded and never lazy-loads on AsyncSession.
+# Written only on a miss, so every entry is re-read from the DB at least once per TTL; this
+# bounds staleness when other workers or the DB itself change hosts.
+_HOST_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
 # PUBLIC_INTERFACE
 @app.post("/api/visitor/checkin-finalize", response_model=VisitLogOut, tags=["visitor"])
-def visitor_checkin_finalize(payload: Dict[str, Any], db: Session = Depends(get_db)):
+async def visitor_checkin_finalize(payload: Dict[str, Any], db: AsyncSession = Depends(get_db)):
     """
     Finalizes visitor check-in.
     Expects all fields in payload.
@@ -224,39 +249,56 @@ def visitor_checkin_finalize(payload: Dict[str, Any], db: Session = Depends(get_
     except Exception:
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Missing required check-in fields.")
 
-    # Get or create Visitor
-    visitor = db.query(Visitor).filter_by(full_name=full_name, email=email).first()
-    if not visitor:
-        visitor = Visitor(full_name=full_name, email=email, phone=phone, id_number=id_number)
-        db.add(visitor)
-        db.commit()
-        db.refresh(visitor)
-    # Get or create Host
-    host = db.query(Host).filter_by(email=host_email).first()
-    if not host:
-        host = Host(full_name=host_email.split("@")[0], email=host_email)
-        db.add(host)
-        db.commit()
-        db.refresh(host)
-    # Create new VisitLog
-    visit = VisitLog(
-        visitor_id=visitor.id,
-        host_id=host.id,
-        purpose=purpose,
-        status="checked_in"
-    )
-    db.add(visit)
-    db.commit()
-    db.refresh(visit)
-    return VisitLogOut(
-        id=visit.id,
-        visitor=visitor,
-        host=host,
-        purpose=visit.purpose,
-        check_in_time=visit.check_in_time,
-        check_out_time=visit.check_out_time,
-        status=visit.status,
-    )
+    # One transaction for the whole check-in instead of a commit per row. A cached host that has
+    # since been deleted fails the FK check: evict it and retry once through the upsert.
+    for attempt in (1, 2):
+        host_snapshot = _HOST_CACHE.get(host_email)
+        try:
+            async with db.begin():
+                # Get or create Visitor (visitors has no unique key to upsert against)
+                visitor = await db.scalar(select(Visitor).filter_by(full_name=full_name, email=email))
+                if not visitor:
+                    visitor = Visitor(full_name=full_name, email=email, phone=phone, id_number=id_number)
+                    db.add(visitor)
+                    await db.flush()
+                # Get or create Host: recently seen hosts are re-attached from the cache without any SQL,
+                # others go through a single upsert (the no-op update makes RETURNING yield existing rows too)
+                if host_snapshot is not None:
+                    cached_host = Host(**host_snapshot)
+                    make_transient_to_detached(cached_host)
+                    host = await db.merge(cached_host, load=False)
+                else:
+                    host_insert = pg_insert(Host).values(full_name=host_email.split("@")[0], email=host_email)
+                    host = await db.scalar(
+                        host_insert.on_conflict_do_update(
+                            index_elements=[Host.email],
+                            # No-op on a non-key column: takes FOR NO KEY UPDATE, which doesn't block the
+                            # FK checks of concurrent check-ins to this host (SET email would lock FOR UPDATE)
+                            set_={"full_name": Host.full_name},
+                        ).returning(Host)
+                    )
+                # Create new VisitLog
+                visit = VisitLog(
+                    visitor=visitor,
+                    host=host,
+                    purpose=purpose,
+                    status="checked_in"
+                )
+                db.add(visit)
+        except IntegrityError:
+            if host_snapshot is None or attempt == 2:
+                raise
+            _HOST_CACHE.pop(host_email, None)
+            db.expunge_all()
+        else:
+            break
+    # Cache misses only once committed, so a rolled-back insert never leaves a dangling host id behind.
+    # Hits are not re-written: that would restart the TTL and keep a busy host's entry alive forever.
+    if host_snapshot is None:
+        _HOST_CACHE[host_email] = {c.key: getattr(host, c.key) for c in Host.__table__.columns}
+    # No refresh needed: SQLAlchemy's default eager_defaults='auto' already fetched ids and server
+    # defaults (check_in_time, created_at) via INSERT ... RETURNING on flush
+    return visit
 
 # -------------------- OCR: ID Upload --------------------
 
@@ -268,15 +310,17 @@ async def upload_id_ocr(file: UploadFile = File(...)):
     Integrates with Tesseract OCR (if available).
     Returns extracted fields (OCR output or fallback).
     """
-    image_bytes = await file.read()
-    ocr_result = perform_ocr_on_image(image_bytes)
+    # Starlette has already spooled the upload (in memory up to 1 MB, then on disk):
+    # hand that file object over rather than copying it into one bytes object.
+    # OCR/STT/TTS are blocking and can take seconds: keep them off the event loop
+    ocr_result = await run_in_threadpool(perform_ocr_on_image, file.file)
     if "error" in ocr_result:
         ext_fields = {
             "full_name": "Demo Person",
             "id_number": "ID123456789",
             "dob": "1990-01-01"
         }
-        return JSONResponse(
+        return ORJSONResponse(
             {"status": "fallback", "ocr_fields": ext_fields, "filename": file.filename, "message": ocr_result["error"]}
         )
     else:
@@ -298,13 +342,19 @@ async def speech_to_text_stub(file: UploadFile = File(...), language: Optional[s
     """
     Accepts audio file; returns speech-to-text transcript.
     """
-    audio_bytes = await file.read()
-    stt_result = perform_speech_to_text(audio_bytes, language=language or "en-US")
+    stt_result = await run_in_threadpool(perform_speech_to_text, file.file, language=language or "en-US")
     if "error" in stt_result:
         transcript = "This is a dummy transcript of the audio (could not perform real STT: %s)" % stt_result["error"]
         return {"transcript": transcript, "language": language, "filename": file.filename}
     return {**stt_result, "filename": file.filename}
 
+# Fallback TTS audio: demo WAV header w/silence, built once at import
+_SILENT_WAV = (
+    b'RIFF$\x00\x00\x00WAVEfmt '
+    b'\x10\x00\x00\x00\x01\x00\x01\x00D\xac\x00\x00\x88X\x01\x00'
+    b'\x02\x00\x10\x00data\x00\x00\x00\x00'
+)
+
 # PUBLIC_INTERFACE
 @app.post("/api/speech/tts", tags=["speech"])
 async def text_to_speech_stub(request: TextToSpeechRequest):
@@ -312,15 +362,11 @@ async def text_to_speech_stub(request: TextToSpeechRequest):
     Accepts text and returns speech audio stream (TTS).
     Responds with real audio if TTS available, else dummy wav.
     """
-    wav_data = perform_text_to_speech(request.text, request.language or "en")
+    wav_data = await run_in_threadpool(perform_text_to_speech, request.text, request.language or "en")
     if not wav_data:
         # Fallback: return demo WAV header w/silence
-        wav_data = (
-            b'RIFF$\x00\x00\x00WAVEfmt '
-            b'\x10\x00\x00\x00\x01\x00\x01\x00D\xac\x00\x00\x88X\x01\x00'
-            b'\x02\x00\x10\x00data\x00\x00\x00\x00'
-        )
-    return StreamingResponse(io.BytesIO(wav_data), media_type="audio/wav")
+        return Response(content=_SILENT_WAV, media_type="audio/wav")
+    return Response(content=wav_data, media_type="audio/wav")
 
 # -------------------- Notifications --------------------
 
@@ -452,51 +498,77 @@ def notify_host(body: Dict[str, Any] = Body(...)):
 
 # PUBLIC_INTERFACE
 @app.get("/api/admin/visitors", response_model=List[VisitorOut], tags=["admin"])
-def get_visitors(skip: int = 0, limit: int = 25, db: Session = Depends(get_db)):
+async def get_visitors(skip: int = 0, limit: int = 25, db: AsyncSession = Depends(get_db)):
     """
     List all visitors (paginated).
     """
-    objs = db.query(Visitor).offset(skip).limit(limit).all()
-    return objs
+    # Select only the VisitorOut columns and skip ORM object construction
+    result = await db.execute(
+        select(Visitor.id, Visitor.full_name, Visitor.email, Visitor.phone, Visitor.id_number, Visitor.created_at)
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.mappings().all()
 
 # PUBLIC_INTERFACE
 @app.get("/api/admin/visitlogs", response_model=List[VisitLogOut], tags=["admin"])
-def get_visitlogs(skip: int = 0, limit: int = 25, db: Session = Depends(get_db)):
+async def get_visitlogs(
+    skip: int = 0,
+    limit: int = 25,
+    status: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
     """
     List all visit logs (most recent first, paginated).
+    Optionally filtered by status (e.g. "checked_in" for visitors currently on site).
     """
-    logs = (db.query(VisitLog)
-            .order_by(VisitLog.check_in_time.desc())
-            .offset(skip)
-            .limit(limit)
-            .all())
-    return [
-        VisitLogOut(
-            id=log.id,
-            visitor=log.visitor,
-            host=log.host,
-            purpose=log.purpose,
-            check_in_time=log.check_in_time,
-            check_out_time=log.check_out_time,
-            status=log.status,
-        ) for log in logs
-    ]
+    # Load visitor and host in the same statement; lazy loading is not available on AsyncSession.
+    stmt = select(VisitLog).options(joinedload(VisitLog.visitor), joinedload(VisitLog.host))
+    if status:
+        stmt = stmt.where(VisitLog.status == status)
+    result = await db.execute(stmt.order_by(VisitLog.check_in_time.desc()).offset(skip).limit(limit))
+    return result.scalars().all()
 
 # PUBLIC_INTERFACE
 @app.get("/api/admin/hosts", response_model=List[HostOut], tags=["admin"])
-def get_hosts(skip: int = 0, limit: int = 25, db: Session = Depends(get_db)):
+async def get_hosts(skip: int = 0, limit: int = 25, db: AsyncSession = Depends(get_db)):
     """
     List all hosts/employees.
     """
-    return db.query(Host).offset(skip).limit(limit).all()
+    result = await db.execute(
+        select(Host.id, Host.full_name, Host.email, Host.phone, Host.department)
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.mappings().all()
 
 # PUBLIC_INTERFACE
 @app.get("/api/admin/users", response_model=List[AdminUserOut], tags=["admin"])
-def get_admin_users(skip: int = 0, limit: int = 25, db: Session = Depends(get_db)):
+async def get_admin_users(skip: int = 0, limit: int = 25, db: AsyncSession = Depends(get_db)):
     """
     List all admin users (for dashboard).
     """
-    return db.query(AdminUser).offset(skip).limit(limit).all()
+    # Projection also keeps hashed_password from ever being read for this listing
+    result = await db.execute(
+        select(AdminUser.id, AdminUser.username, AdminUser.full_name, AdminUser.is_active, AdminUser.created_at)
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.mappings().all()
+
+# PUBLIC_INTERFACE
+@app.get("/api/admin/dashboard", response_model=AdminDashboardOut, tags=["admin"])
+async def get_dashboard(limit: int = 25, db: AsyncSession = Depends(get_db)):
+    """
+    Dashboard summary: first page of visitors, visit logs and hosts.
+    Lets dashboard widgets share one HTTP request and one pooled connection
+    instead of issuing three separate admin calls.
+    """
+    return {
+        "visitors": await get_visitors(skip=0, limit=limit, db=db),
+        "visitlogs": await get_visitlogs(skip=0, limit=limit, db=db),
+        "hosts": await get_hosts(skip=0, limit=limit, db=db),
+    }
 
 # -------------------- Real-time Field Validation --------------------
 
@@ -514,11 +586,11 @@ def validate_field(payload: FieldValidationRequest):
 
     # Example: validation logic (email/phone/id)
     if field == "email":
-        if "@" not in value:
+        if not _EMAIL_RE.fullmatch(value):
             is_valid = False
             errors.append("Invalid email format.")
     elif field == "phone":
-        if not value.isdigit() or not (7 <= len(value) <= 15):
+        if not _PHONE_RE.fullmatch(value):
             is_valid = False
             errors.append("Invalid phone number; must be 7-15 digits.")
     elif field == "id_number":
@@ -11,6 +11,7 @@ from sqlalchemy import (
     ForeignKey,
     func,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import relationship, declarative_base
 
@@ -34,6 +35,11 @@ class Visitor(Base):
 
     visit_logs = relationship("VisitLog", back_populates="visitor")
 
+    __table_args__ = (
+        # Get-or-create lookup in checkin-finalize filters on both columns.
+        Index("ix_visitor_fullname_email", "full_name", "email"),
+    )
+
 
 # PUBLIC_INTERFACE
 class Host(Base):
@@ -71,6 +77,13 @@ class VisitLog(Base):
     visitor = relationship("Visitor", back_populates="visit_logs")
     host = relationship("Host", back_populates="visit_logs")
 
+    __table_args__ = (
+        # Serves the admin "most recent first" listing without sorting the whole table.
+        Index("ix_visitlog_checkin_desc", check_in_time.desc()),
+        # Same ordering within one status, for dashboards filtering e.g. on "checked_in".
+        Index("ix_visitlog_status_checkin_desc", status, check_in_time.desc()),
+    )
+
 
 # PUBLIC_INTERFACE
 class AdminUser(Base):